@@ -61,12 +61,13 @@ interface WeatherData {
 }
 
 interface ProgressUpdate {
-  type: 'progress' | 'error' | 'completed' | 'keepalive'
+  type: 'progress' | 'progress_batch' | 'error' | 'completed' | 'keepalive'
   current?: number
   total?: number
   zip_code?: string
   status?: string
   message?: string
+  items?: { zip_code: string; status: string }[]
 }
 
 export default function WeatherFetcher() {
@@ -178,6 +179,7 @@ export default function WeatherFetcher() {
         
         switch (update.type) {
           case 'progress':
+          case 'progress_batch':
             if (update.current !== undefined && update.total !== undefined) {
               const progressPercent = (update.current / update.total) * 100
               setProgress(progressPercent)
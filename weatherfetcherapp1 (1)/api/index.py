@@ -1,33 +1,260 @@
 from flask import Flask, request, jsonify, Response, send_file
 from flask_cors import CORS
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import csv
 import io
 import threading
 import time
 import uuid
 from datetime import datetime, timezone
-import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict, deque
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from operator import attrgetter
+import orjson
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
 import queue
 import os
-import traceback
+import logging
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+logger = logging.getLogger(__name__)
+# urllib3 logs retries with the full request URL, which carries the caller's API key
+logging.getLogger('urllib3').setLevel(logging.ERROR)
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
 
-# Global storage for sessions and progress
-sessions = {}
-progress_queues = {}
+class ExpiringLRUCache:
+    """Thread-safe LRU cache whose entries also expire after a fixed TTL"""
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl  # Seconds an entry lives after it was stored
+        self._data = OrderedDict()  # key -> (expires_at, value), least recently used first
+        self._lock = threading.Lock()
+        self._next_sweep = 0.0
+    
+    def get(self, key, default=None):
+        """Return the live value for key, marking it as recently used"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            
+            self._data.move_to_end(key)
+            return value
+    
+    def __setitem__(self, key, value):
+        with self._lock:
+            now = time.monotonic()
+            self._data[key] = (now + self.ttl, value)
+            self._data.move_to_end(key)
+            
+            # Drop expired entries (scanning at most ten times per TTL), then
+            # the least recently used ones beyond maxsize
+            if now >= self._next_sweep:
+                for stale in [k for k, (expires_at, _) in self._data.items() if expires_at <= now]:
+                    del self._data[stale]
+                self._next_sweep = now + self.ttl / 10
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+# Global storage for sessions; each entry holds the progress queue while the
+# client is streaming, plus results and CSV once the fetch completes
+sessions = ExpiringLRUCache(maxsize=256, ttl=3600)
+
+# Recently fetched weather rows by (api_key, zip_code); conditions barely change
+# within minutes. Keying by API key means a hit is only served to a caller whose
+# key already fetched that ZIP successfully
+_WX_CACHE = ExpiringLRUCache(maxsize=4096, ttl=300)
+
+# Worker threads shared by all fetches. Work is network-bound, so the pool
+# is sized for concurrent sessions, not CPU count
+MAX_WORKERS = 64
+EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='wx')
+
+# Most requests one fetch keeps in flight, so one session can't fill the
+# shared pool; each fetcher's connection pool is sized to match
+FETCH_CONCURRENCY = 20
+
+UTC = timezone.utc
+
+# Pre-encoded health check body, refreshed at most once per second
+_HEALTH_CACHE = {'ts': 0.0, 'body': b''}
+_HEALTH_LOCK = threading.Lock()
+
+# Column order for CSV exports
+FIELDNAMES = (
+    'zip_code', 'city', 'date_time_utc', 'temp_f', 'temp_c',
+    'feels_like_f', 'feels_like_c', 'humidity', 'pressure_hpa',
+    'wind_speed_mps', 'wind_direction_deg', 'cloud_cover_percent',
+    'sunrise_utc', 'sunset_utc', 'weather_description'
+)
+# csv.writer terminates rows with \r\n, so the header matches
+CSV_HEADER = (','.join(FIELDNAMES) + '\r\n').encode()
+_csv_row = attrgetter(*FIELDNAMES)
+
+@dataclass(slots=True, frozen=True)
+class WeatherRow:
+    """Weather data for one ZIP code; fields follow FIELDNAMES order"""
+    # Frozen because cached rows are shared by every session that hits them
+    zip_code: str
+    city: str
+    date_time_utc: str
+    temp_f: float
+    temp_c: float
+    feels_like_f: float
+    feels_like_c: float
+    humidity: int
+    pressure_hpa: int
+    wind_speed_mps: float
+    wind_direction_deg: int
+    cloud_cover_percent: int
+    sunrise_utc: str
+    sunset_utc: str
+    weather_description: str
+
+# Seconds to keep collecting progress updates before flushing them to the client
+SSE_FLUSH_WINDOW = 0.05
+
+# Event types carrying the cumulative current/total counters
+PROGRESS_TYPES = ('progress', 'progress_batch')
+
+def _sse(obj):
+    """Encode an object as a server-sent event frame"""
+    return b"data: " + orjson.dumps(obj) + b"\n\n"
+
+@lru_cache(maxsize=4096)
+def _iso_utc(ts):
+    """Format a Unix timestamp as an ISO 8601 UTC string"""
+    return datetime.fromtimestamp(ts, UTC).isoformat()
+
+def _coalesce(updates):
+    """Collapse progress updates in a batch into the newest one"""
+    # Progress counters are cumulative, so only the newest update matters, but
+    # its items list absorbs those of earlier batches; errors and the
+    # completion signal are always kept, in order
+    progress = [i for i, update in enumerate(updates) if update.get('type') in PROGRESS_TYPES]
+    if len(progress) < 2:
+        return updates
+    
+    latest = updates[progress[-1]]
+    if latest['type'] == 'progress_batch':
+        latest = dict(latest, items=[
+            item for i in progress if updates[i]['type'] == 'progress_batch'
+            for item in updates[i]['items']
+        ])
+    
+    superseded = set(progress[:-1])
+    return [
+        latest if i == progress[-1] else update
+        for i, update in enumerate(updates) if i not in superseded
+    ]
+
+def _build_csv(results):
+    """Serialize result rows to CSV bytes in FIELDNAMES order"""
+    csv_bytes = io.BytesIO()
+    csv_bytes.write(CSV_HEADER)
+    text = io.TextIOWrapper(csv_bytes, encoding='utf-8', newline='', write_through=True)
+    writer = csv.writer(text)
+    writer.writerows(map(_csv_row, results))
+    data = csv_bytes.getvalue()
+    text.close()
+    return data
+
+class TokenBucket:
+    """Thread-safe token bucket for pacing upstream API calls"""
+    def __init__(self, capacity, rate):
+        self.capacity = capacity
+        self.refill_rate = rate  # Tokens added per second
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Take one token, sleeping only if the bucket is empty"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.refill_rate)
+            self.last = now
+            
+            # Reserve the token up front so concurrent callers queue behind each other
+            self.tokens -= 1
+            delay = -self.tokens / self.refill_rate if self.tokens < 0 else 0
+        
+        if delay > 0:
+            time.sleep(delay)
+
+# Rate limit buckets shared by every fetch that uses the same API key
+_BUCKETS = ExpiringLRUCache(maxsize=1024, ttl=3600)
+_BUCKETS_LOCK = threading.Lock()
+
+def _bucket_for(api_key):
+    """Return the token bucket shared by all fetches for an API key"""
+    with _BUCKETS_LOCK:
+        bucket = _BUCKETS.get(api_key)
+        if bucket is None:
+            # OpenWeatherMap free tier allows 60 calls/minute; permit short bursts
+            bucket = TokenBucket(capacity=10, rate=60/60)
+        
+        # Store on every use so the bucket of a key in use never expires
+        _BUCKETS[api_key] = bucket
+        return bucket
+
+class ProgressChannel:
+    """Single-producer, single-consumer queue for progress updates"""
+    def __init__(self):
+        self._dq = deque()
+        self._cv = threading.Condition()
+    
+    def put(self, item):
+        with self._cv:
+            self._dq.append(item)
+            self._cv.notify()
+    
+    def get(self, timeout=None):
+        """Pop the oldest update, raising queue.Empty if none arrives in time"""
+        with self._cv:
+            if not self._cv.wait_for(lambda: self._dq, timeout):
+                raise queue.Empty
+            return self._dq.popleft()
 
 class WeatherFetcher:
-    def __init__(self, api_key, zip_codes, session_id):
+    def __init__(self, api_key, zip_codes, session_id, fresh=False):
         self.api_key = api_key
         self.zip_codes = zip_codes
         self.session_id = session_id
+        self.fresh = fresh  # Skip the ZIP cache and always call the API
         self.results = []
-        self.progress_queue = queue.Queue()
-        progress_queues[session_id] = self.progress_queue
+        self.completed = 0
+        self.progress_queue = ProgressChannel()
+        sessions[session_id] = {'progress_queue': self.progress_queue}
+        
+        # Reuse pooled keep-alive connections across worker threads
+        self.session = requests.Session()
+        self.session.mount('http://', HTTPAdapter(
+            pool_connections=FETCH_CONCURRENCY,
+            pool_maxsize=FETCH_CONCURRENCY,
+            # Retry transient server errors only. A 429 means the quota is already
+            # spent, and retrying it (or sleeping on Retry-After) here would bypass
+            # the token bucket and park a shared worker on one key's limit
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=[500, 502, 503, 504],
+                respect_retry_after_header=False,
+                raise_on_status=False  # Let the status code checks below report the error
+            )
+        ))
+        
+        self.bucket = _bucket_for(api_key)
         
     def fetch_weather_for_zip(self, zip_code):
         """Fetch weather data for a single ZIP code"""
@@ -40,30 +267,31 @@ class WeatherFetcher:
                 'units': 'metric'  # Get Celsius, we'll convert to Fahrenheit
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 
                 # Extract weather data
-                weather_data = {
-                    'zip_code': zip_code,
-                    'city': data['name'],
-                    'date_time_utc': datetime.fromtimestamp(data['dt'], tz=timezone.utc).isoformat(),
-                    'temp_f': round(data['main']['temp'] * 9/5 + 32, 1),
-                    'temp_c': round(data['main']['temp'], 1),
-                    'feels_like_f': round(data['main']['feels_like'] * 9/5 + 32, 1),
-                    'feels_like_c': round(data['main']['feels_like'], 1),
-                    'humidity': data['main']['humidity'],
-                    'pressure_hpa': data['main']['pressure'],
-                    'wind_speed_mps': data.get('wind', {}).get('speed', 0),
-                    'wind_direction_deg': data.get('wind', {}).get('deg', 0),
-                    'cloud_cover_percent': data.get('clouds', {}).get('all', 0),
-                    'sunrise_utc': datetime.fromtimestamp(data['sys']['sunrise'], tz=timezone.utc).isoformat(),
-                    'sunset_utc': datetime.fromtimestamp(data['sys']['sunset'], tz=timezone.utc).isoformat(),
-                    'weather_description': data['weather'][0]['description']
-                }
+                weather_data = WeatherRow(
+                    zip_code=zip_code,
+                    city=data['name'],
+                    date_time_utc=_iso_utc(int(data['dt'])),
+                    temp_f=round(data['main']['temp'] * 9/5 + 32, 1),
+                    temp_c=round(data['main']['temp'], 1),
+                    feels_like_f=round(data['main']['feels_like'] * 9/5 + 32, 1),
+                    feels_like_c=round(data['main']['feels_like'], 1),
+                    humidity=data['main']['humidity'],
+                    pressure_hpa=data['main']['pressure'],
+                    wind_speed_mps=data.get('wind', {}).get('speed', 0),
+                    wind_direction_deg=data.get('wind', {}).get('deg', 0),
+                    cloud_cover_percent=data.get('clouds', {}).get('all', 0),
+                    sunrise_utc=_iso_utc(int(data['sys']['sunrise'])),
+                    sunset_utc=_iso_utc(int(data['sys']['sunset'])),
+                    weather_description=data['weather'][0]['description']
+                )
                 
+                _WX_CACHE[(self.api_key, zip_code)] = weather_data
                 return weather_data
             else:
                 error_msg = f"API Error {response.status_code}"
@@ -84,7 +312,6 @@ class WeatherFetcher:
     def fetch_all_weather_data(self):
         """Fetch weather data for all ZIP codes using threading"""
         total_zips = len(self.zip_codes)
-        completed = 0
         
         # Send initial progress
         self.progress_queue.put({
@@ -95,71 +322,106 @@ class WeatherFetcher:
             'status': 'processing'
         })
         
-        # Use ThreadPoolExecutor for concurrent requests
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            # Submit all tasks
-            future_to_zip = {
-                executor.submit(self.fetch_weather_for_zip, zip_code): zip_code 
-                for zip_code in self.zip_codes
-            }
-            
-            # Process completed tasks
-            for future in as_completed(future_to_zip):
-                zip_code = future_to_zip[future]
-                completed += 1
+        # Submit to the shared executor for concurrent requests
+        future_to_zip = {}
+        pending = set()
+        try:
+            for zip_code in self.zip_codes:
+                # Wait for a slot before submitting more of this fetch's requests
+                while len(pending) >= FETCH_CONCURRENCY:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    self._report_done(done, future_to_zip)
                 
-                try:
-                    result = future.result()
-                    
-                    if 'error' in result:
-                        # Send error progress update
-                        self.progress_queue.put({
-                            'type': 'error',
-                            'zip_code': zip_code,
-                            'message': result['error']
-                        })
-                    else:
-                        self.results.append(result)
-                    
-                    # Send progress update
-                    self.progress_queue.put({
-                        'type': 'progress',
-                        'current': completed,
-                        'total': total_zips,
-                        'zip_code': zip_code,
-                        'status': 'completed'
-                    })
-                    
-                except Exception as e:
-                    self.progress_queue.put({
-                        'type': 'error',
-                        'zip_code': zip_code,
-                        'message': f'Processing error: {str(e)}'
-                    })
+                cached = None if self.fresh else _WX_CACHE.get((self.api_key, zip_code))
+                if cached is not None:
+                    # Cache hits cost neither a request nor a rate limit token
+                    future = Future()
+                    future.set_result(cached)
+                else:
+                    # Pace here rather than in the worker, so shared workers
+                    # never sleep on one API key's rate limit
+                    self.bucket.acquire()
+                    future = EXECUTOR.submit(self.fetch_weather_for_zip, zip_code)
+                
+                future_to_zip[future] = zip_code
+                pending.add(future)
                 
-                # Rate limiting - small delay between requests
-                time.sleep(0.1)
+                # Report anything that already finished while submission is paced
+                done, pending = wait(pending, timeout=0)
+                self._report_done(done, future_to_zip)
+            
+            # Process completed tasks, draining every future that finished together
+            while pending:
+                done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                self._report_done(done, future_to_zip)
+        finally:
+            self.session.close()
+        
+        # Store results in session before signalling completion, so the
+        # client can fetch them as soon as it sees the completed event
+        session = sessions.get(self.session_id, {})
+        session.update({
+            'results': self.results,
+            'csv_bytes': _build_csv(self.results),
+            'completed_at': datetime.now().isoformat()
+        })
+        sessions[self.session_id] = session
         
         # Send completion signal
         self.progress_queue.put({
             'type': 'completed',
-            'current': completed,
+            'current': self.completed,
             'total': total_zips,
             'message': f'Successfully processed {len(self.results)} out of {total_zips} ZIP codes'
         })
+
+    def _report_done(self, done, future_to_zip):
+        """Collect a group of finished futures and send one progress update"""
+        if not done:
+            return
         
-        # Store results in session
-        sessions[self.session_id] = {
-            'results': self.results,
-            'completed_at': datetime.now().isoformat()
-        }
+        items = []
+        for future in done:
+            zip_code = future_to_zip[future]
+            self.completed += 1
+            
+            try:
+                result = future.result()
+                
+                if not isinstance(result, WeatherRow):
+                    # Send error progress update
+                    self.progress_queue.put({
+                        'type': 'error',
+                        'zip_code': zip_code,
+                        'message': result['error']
+                    })
+                    items.append({'zip_code': zip_code, 'status': 'error'})
+                else:
+                    self.results.append(result)
+                    items.append({'zip_code': zip_code, 'status': 'completed'})
+            
+            except Exception as e:
+                self.progress_queue.put({
+                    'type': 'error',
+                    'zip_code': zip_code,
+                    'message': f'Processing error: {str(e)}'
+                })
+                items.append({'zip_code': zip_code, 'status': 'error'})
+        
+        # Send one progress update for the whole group
+        self.progress_queue.put({
+            'type': 'progress_batch',
+            'current': self.completed,
+            'total': len(self.zip_codes),
+            'zip_code': items[-1]['zip_code'],
+            'items': items
+        })
 
 # Add error handler
 @app.errorhandler(Exception)
 def handle_exception(e):
     # Log the error
-    print(f"Error: {str(e)}")
-    print(traceback.format_exc())
+    logger.exception("Unhandled error: %s", e)
     
     return jsonify({
         'error': str(e),
@@ -171,13 +433,21 @@ def handle_exception(e):
 def fetch_weather():
     """Start weather fetching process"""
     try:
-        print("Received fetch-weather request")
+        logger.info("Received fetch-weather request")
         
         if not request.is_json:
             return jsonify({'error': 'Content-Type must be application/json'}), 400
             
-        data = request.get_json()
-        print(f"Request data: {data}")
+        # Decode the body once with orjson, bypassing Flask's cached JSON parser
+        try:
+            data = orjson.loads(request.get_data(cache=False))
+        except orjson.JSONDecodeError:
+            return jsonify({'error': 'Invalid JSON'}), 400
+        
+        if not isinstance(data, dict):
+            return jsonify({'error': 'Request body must be a JSON object'}), 400
+        
+        logger.debug("Request data: %s", data)
         
         api_key = data.get('api_key')
         zip_codes = data.get('zip_codes', [])
@@ -190,10 +460,12 @@ def fetch_weather():
         
         # Generate session ID
         session_id = str(uuid.uuid4())
-        print(f"Created session: {session_id}")
+        logger.info("Created session: %s", session_id)
         
         # Create weather fetcher
-        fetcher = WeatherFetcher(api_key, zip_codes, session_id)
+        # ?fresh=1 bypasses cached weather rows
+        fresh = request.args.get('fresh') == '1'
+        fetcher = WeatherFetcher(api_key, zip_codes, session_id, fresh=fresh)
         
         # Start fetching in background thread
         thread = threading.Thread(target=fetcher.fetch_all_weather_data)
@@ -203,72 +475,70 @@ def fetch_weather():
         return jsonify({'session_id': session_id})
         
     except Exception as e:
-        print(f"Error in fetch_weather: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error in fetch_weather: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/progress/<session_id>')
 def progress_stream(session_id):
     """Server-sent events for progress updates"""
     def generate():
-        if session_id not in progress_queues:
-            yield f"data: {json.dumps({'type': 'error', 'message': 'Session not found'})}\n\n"
+        session = sessions.get(session_id)
+        if session is None or 'progress_queue' not in session:
+            yield _sse({'type': 'error', 'message': 'Session not found'})
             return
         
-        progress_queue = progress_queues[session_id]
+        progress_queue = session['progress_queue']
         
-        while True:
-            try:
-                # Wait for progress update with timeout
-                update = progress_queue.get(timeout=30)
-                yield f"data: {json.dumps(update)}\n\n"
+        try:
+            while True:
+                try:
+                    # Wait for progress update with timeout
+                    batch = [progress_queue.get(timeout=30)]
                 
-                # If completed, break the loop
-                if update.get('type') == 'completed':
-                    break
+                    # Collect anything else that arrives within the flush window
+                    flush_at = time.monotonic() + SSE_FLUSH_WINDOW
+                    while batch[-1].get('type') != 'completed':
+                        remaining = flush_at - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        try:
+                            batch.append(progress_queue.get(timeout=remaining))
+                        except queue.Empty:
+                            break
+                
+                    # Write the whole batch as a single chunk
+                    yield b"".join(_sse(update) for update in _coalesce(batch))
+                
+                    # If completed, break the loop
+                    if batch[-1].get('type') == 'completed':
+                        break
                     
-            except queue.Empty:
-                # Send keepalive
-                yield f"data: {json.dumps({'type': 'keepalive'})}\n\n"
-            except Exception as e:
-                yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
-                break
+                except queue.Empty:
+                    # Send keepalive
+                    yield _sse({'type': 'keepalive'})
+                except Exception as e:
+                    yield _sse({'type': 'error', 'message': str(e)})
+                    break
+        finally:
+            # The stream is done with the queue; release it so pending items can be collected
+            session.pop('progress_queue', None)
     
     return Response(generate(), mimetype='text/event-stream')
 
 @app.route('/api/download/<session_id>')
 def download_csv(session_id):
     """Download CSV file with weather data"""
-    if session_id not in sessions:
+    session = sessions.get(session_id)
+    if session is None or 'results' not in session:
         return jsonify({'error': 'Session not found'}), 404
     
-    results = sessions[session_id]['results']
+    results = session['results']
     
     if not results:
         return jsonify({'error': 'No data available'}), 404
     
-    # Create CSV in memory
-    output = io.StringIO()
-    fieldnames = [
-        'zip_code', 'city', 'date_time_utc', 'temp_f', 'temp_c',
-        'feels_like_f', 'feels_like_c', 'humidity', 'pressure_hpa',
-        'wind_speed_mps', 'wind_direction_deg', 'cloud_cover_percent',
-        'sunrise_utc', 'sunset_utc', 'weather_description'
-    ]
-    
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    writer.writeheader()
-    
-    for result in results:
-        writer.writerow(result)
-    
-    # Convert to bytes
-    csv_data = output.getvalue().encode('utf-8')
-    output.close()
-    
-    # Create file-like object
-    csv_file = io.BytesIO(csv_data)
-    csv_file.seek(0)
+    # CSV is built once when the fetch completes
+    csv_file = io.BytesIO(session['csv_bytes'])
     
     return send_file(
         csv_file,
@@ -280,10 +550,11 @@ def download_csv(session_id):
 @app.route('/api/preview/<session_id>')
 def preview_data(session_id):
     """Get preview of weather data (first 5 results)"""
-    if session_id not in sessions:
+    session = sessions.get(session_id)
+    if session is None or 'results' not in session:
         return jsonify({'error': 'Session not found'}), 404
     
-    results = sessions[session_id]['results']
+    results = session['results']
     
     if not results:
         return jsonify({'error': 'No data available'}), 404
@@ -292,7 +563,7 @@ def preview_data(session_id):
     preview_results = results[:5]
     
     return jsonify({
-        'data': preview_results,
+        'data': [asdict(result) for result in preview_results],
         'total_results': len(results),
         'preview_count': len(preview_results)
     })
@@ -300,7 +571,18 @@ def preview_data(session_id):
 @app.route('/api/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({'status': 'healthy', 'timestamp': datetime.now().isoformat()})
+    now = time.time()
+    with _HEALTH_LOCK:
+        if now - _HEALTH_CACHE['ts'] > 1.0:
+            _HEALTH_CACHE['body'] = orjson.dumps({
+                'status': 'healthy',
+                'timestamp': datetime.fromtimestamp(now, UTC).isoformat()
+            })
+            _HEALTH_CACHE['ts'] = now
+        body = _HEALTH_CACHE['body']
+    
+    return Response(body, mimetype='application/json')
 
-if __name__ == '__main__':
+# Production runs under gunicorn (see start_backend.py); DEV=1 uses the debug server
+if __name__ == '__main__' and os.getenv('DEV') == '1':
     app.run(debug=True, port=5328)
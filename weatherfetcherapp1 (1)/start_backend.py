@@ -19,7 +19,8 @@ def install_requirements():
 
 def start_server():
     """Start the Flask server"""
-    print("Starting Flask backend server...")
+    dev_mode = os.getenv('DEV') == '1'
+    print(f"Starting Flask backend server ({'dev server' if dev_mode else 'gunicorn + gevent'})...")
     print("Server will run on http://127.0.0.1:5328")
     print("Press Ctrl+C to stop the server")
     print("-" * 50)
@@ -28,8 +29,20 @@ def start_server():
         # Change to the directory containing the script
         os.chdir(os.path.dirname(os.path.abspath(__file__)))
         
-        # Start the Flask server
-        subprocess.run([sys.executable, "api/index.py"])
+        if dev_mode:
+            # Start Flask's debug server
+            subprocess.run([sys.executable, "api/index.py"])
+        else:
+            # Sessions live in process memory, so run a single gevent worker;
+            # it handles many concurrent SSE streams cooperatively
+            subprocess.run([
+                sys.executable, "-m", "gunicorn",
+                "-k", "gevent",
+                "-w", "1",
+                "--worker-connections", "1000",
+                "-b", "127.0.0.1:5328",
+                "api.index:app"
+            ])
     except KeyboardInterrupt:
         print("\n🛑 Server stopped by user")
     except Exception as e: